@@ -7,7 +7,7 @@ import string
 from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Dict, Union, Literal, Annotated
 
 BASE_DIR = Path(__file__).resolve().parent
 
@@ -127,18 +127,73 @@ class TurnBody(BaseModel):
     text: str = Field(..., min_length=1)
 
 
+# Bulk/batch bodies: one request and one transaction for many items (orchestrators).
+BULK_MAX_ITEMS = 500
+
+
+class AgentBulkCreate(BaseModel):
+    agents: List[AgentCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class AgentBulkResult(BaseModel):
+    index: int
+    ok: bool
+    status_code: int
+    detail: Optional[str] = None
+    agent: Optional[AgentOut] = None
+
+
+class StoryBulkCreate(BaseModel):
+    stories: List[StoryCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class JoinOp(JoinBody):
+    op: Literal["join"]
+    story_id: int
+
+
+class TurnOp(TurnBody):
+    op: Literal["turn"]
+    story_id: int
+
+
+BatchOp = Annotated[Union[JoinOp, TurnOp], Field(discriminator="op")]
+
+
+class BatchBody(BaseModel):
+    operations: List[BatchOp] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BatchResult(BaseModel):
+    index: int
+    op: str
+    ok: bool
+    status_code: int
+    detail: Optional[str] = None
+    story: Optional[StoryOut] = None
+
+
 # ---------- Helpers ----------
-def _get_agent_by_name(db: Session, name: str) -> Agent:
-    agent = db.query(Agent).filter(Agent.name == name).first()
+# `cache` lets batch handlers preload rows with one IN query; misses fall back to a lookup.
+def _get_agent_by_name(db: Session, name: str, cache: Optional[Dict[str, Agent]] = None) -> Agent:
+    agent = cache.get(name) if cache is not None else None
+    if agent is None:
+        agent = db.query(Agent).filter(Agent.name == name).first()
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
+    if cache is not None:
+        cache[name] = agent
     return agent
 
 
-def _get_story(db: Session, story_id: int) -> Story:
-    story = db.query(Story).filter(Story.id == story_id).first()
+def _get_story(db: Session, story_id: int, cache: Optional[Dict[int, Story]] = None) -> Story:
+    story = cache.get(story_id) if cache is not None else None
+    if story is None:
+        story = db.query(Story).filter(Story.id == story_id).first()
     if not story:
         raise HTTPException(status_code=404, detail="Story not found")
+    if cache is not None:
+        cache[story_id] = story
     return story
 
 
@@ -169,6 +224,63 @@ def _run_judge_and_end(db: Session, story: Story) -> None:
     story.ended_at = datetime.utcnow()
 
 
+# Join/turn rules shared by the single-item and batch handlers. They validate fully
+# before mutating anything and never commit, so a rejected item leaves the session clean.
+# Participations and turns go through the story's collections so that later items in
+# the same batch see earlier ones without a flush.
+def _apply_join(db: Session, story: Story, agent_name: str, agents: Optional[Dict[str, Agent]] = None) -> None:
+    _check_story_ended(story)
+    if story.status == StoryStatus.active:
+        raise HTTPException(status_code=400, detail="Story already active; cannot join after first turn")
+    agent = _get_agent_by_name(db, agent_name, agents)
+    if any(p.agent_id == agent.id for p in story.participations):
+        raise HTTPException(status_code=409, detail="Agent already in this story")
+    if len(story.participations) >= story.max_participants:
+        raise HTTPException(status_code=400, detail="Max participants reached")
+    story.participations.append(Participation(agent_id=agent.id, agent=agent, turns_used=0))
+
+
+def _apply_turn(db: Session, story: Story, agent_name: str, text: str, agents: Optional[Dict[str, Agent]] = None) -> None:
+    _check_story_ended(story)
+    participant_count = len(story.participations)
+    min_required = getattr(story, "min_participants_to_start", 2)
+    if participant_count < min_required:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At least {min_required} participants are required before submitting turns; currently {participant_count}. Join the story first or wait for more agents.",
+        )
+    agent = _get_agent_by_name(db, agent_name, agents)
+    part = next((p for p in story.participations if p.agent_id == agent.id), None)
+    if not part:
+        raise HTTPException(status_code=403, detail="Agent is not a participant in this story")
+    if part.turns_used >= 2:
+        raise HTTPException(status_code=400, detail="Turn limit exceeded: each agent may speak at most 2 times per story")
+    n_sentences = count_sentences(text)
+    if n_sentences < 2 or n_sentences > 3:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid sentence count: turn must contain 2-3 sentences (got {n_sentences})",
+        )
+    next_round = story.current_round + 1
+    existing_turn = db.query(Turn).filter(Turn.story_id == story.id, Turn.round_number == next_round).first()
+    if existing_turn:
+        raise HTTPException(status_code=409, detail="Round already taken; only one turn per round accepted")
+    # First turn: transition open -> active
+    if story.status == StoryStatus.open:
+        story.status = StoryStatus.active
+    story.turns.append(Turn(agent_id=agent.id, agent=agent, round_number=next_round, text=text))
+    part.turns_used += 1
+    story.current_round = next_round
+
+
+def _end_if_finished(db: Session, story: Story) -> bool:
+    """Judge and end the story once max_rounds is hit or every participant used 2 turns."""
+    if story.current_round >= story.max_rounds or all(p.turns_used >= 2 for p in story.participations):
+        _run_judge_and_end(db, story)
+        return True
+    return False
+
+
 # ---------- API: Agents ----------
 @app.post("/api/agents", response_model=AgentOut)
 def create_agent(body: AgentCreate, db: Session = Depends(get_db)):
@@ -181,6 +293,29 @@ def create_agent(body: AgentCreate, db: Session = Depends(get_db)):
     return agent
 
 
+@app.post("/api/agents/bulk", response_model=List[AgentBulkResult])
+def create_agents_bulk(body: AgentBulkCreate, db: Session = Depends(get_db)):
+    names = {a.name for a in body.agents}
+    taken = {name for (name,) in db.query(Agent.name).filter(Agent.name.in_(names))}
+    results: List[Optional[AgentBulkResult]] = []
+    created = []
+    for i, item in enumerate(body.agents):
+        if item.name in taken:
+            results.append(AgentBulkResult(index=i, ok=False, status_code=409, detail="Agent name already exists"))
+            continue
+        taken.add(item.name)
+        agent = Agent(name=item.name, preference=item.preference, preference_detail=item.preference_detail)
+        created.append((i, agent))
+        results.append(None)
+    db.add_all([agent for _, agent in created])
+    db.flush()
+    # Serialize before commit: commit expires the rows and would reload each one.
+    for i, agent in created:
+        results[i] = AgentBulkResult(index=i, ok=True, status_code=200, agent=AgentOut.model_validate(agent))
+    db.commit()
+    return results
+
+
 @app.get("/api/agents", response_model=List[AgentOut])
 def list_agents(db: Session = Depends(get_db)):
     return db.query(Agent).all()
@@ -196,13 +331,12 @@ def _effective_title(requested: Optional[str]) -> str:
     return requested.strip()
 
 
-@app.post("/api/stories", response_model=StoryOut)
-def create_story(body: StoryCreate, db: Session = Depends(get_db)):
+def _new_story(body: StoryCreate) -> Story:
     title = _effective_title(body.title)
     seed_text = _random_seed()
     min_start = min(body.min_participants_to_start, body.max_participants)
     min_start = max(2, min_start)
-    story = Story(
+    return Story(
         title=title,
         seed_text=seed_text,
         status=StoryStatus.open,
@@ -210,12 +344,27 @@ def create_story(body: StoryCreate, db: Session = Depends(get_db)):
         max_participants=body.max_participants,
         min_participants_to_start=min_start,
     )
+
+
+@app.post("/api/stories", response_model=StoryOut)
+def create_story(body: StoryCreate, db: Session = Depends(get_db)):
+    story = _new_story(body)
     db.add(story)
     db.commit()
     db.refresh(story)
     return story
 
 
+@app.post("/api/stories/bulk", response_model=List[StoryOut])
+def create_stories_bulk(body: StoryBulkCreate, db: Session = Depends(get_db)):
+    stories = [_new_story(item) for item in body.stories]
+    db.add_all(stories)
+    db.flush()
+    out = [StoryOut.model_validate(s) for s in stories]
+    db.commit()
+    return out
+
+
 @app.get("/api/stories", response_model=List[StoryOut])
 def list_stories(
     status: Optional[str] = Query(None, description="open | active | ended"),
@@ -239,20 +388,7 @@ def get_story(story_id: int, db: Session = Depends(get_db)):
 @app.post("/api/stories/{story_id}/join", response_model=StoryOut)
 def join_story(story_id: int, body: JoinBody, db: Session = Depends(get_db)):
     story = _get_story(db, story_id)
-    _check_story_ended(story)
-    if story.status == StoryStatus.active:
-        raise HTTPException(status_code=400, detail="Story already active; cannot join after first turn")
-    agent = _get_agent_by_name(db, body.agent_name)
-    existing = db.query(Participation).filter(
-        Participation.story_id == story_id,
-        Participation.agent_id == agent.id,
-    ).first()
-    if existing:
-        raise HTTPException(status_code=409, detail="Agent already in this story")
-    count = db.query(Participation).filter(Participation.story_id == story_id).count()
-    if count >= story.max_participants:
-        raise HTTPException(status_code=400, detail="Max participants reached")
-    db.add(Participation(story_id=story_id, agent_id=agent.id))
+    _apply_join(db, story, body.agent_name)
     db.commit()
     db.refresh(story)
     return story
@@ -261,56 +397,44 @@ def join_story(story_id: int, body: JoinBody, db: Session = Depends(get_db)):
 @app.post("/api/stories/{story_id}/turns", response_model=StoryOut)
 def submit_turn(story_id: int, body: TurnBody, db: Session = Depends(get_db)):
     story = _get_story(db, story_id)
-    _check_story_ended(story)
-    participant_count = db.query(Participation).filter(Participation.story_id == story_id).count()
-    min_required = getattr(story, "min_participants_to_start", 2)
-    if participant_count < min_required:
-        raise HTTPException(
-            status_code=400,
-            detail=f"At least {min_required} participants are required before submitting turns; currently {participant_count}. Join the story first or wait for more agents.",
-        )
-    agent = _get_agent_by_name(db, body.agent_name)
-    part = db.query(Participation).filter(
-        Participation.story_id == story_id,
-        Participation.agent_id == agent.id,
-    ).first()
-    if not part:
-        raise HTTPException(status_code=403, detail="Agent is not a participant in this story")
-    if part.turns_used >= 2:
-        raise HTTPException(status_code=400, detail="Turn limit exceeded: each agent may speak at most 2 times per story")
-    n_sentences = count_sentences(body.text)
-    if n_sentences < 2 or n_sentences > 3:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid sentence count: turn must contain 2-3 sentences (got {n_sentences})",
-        )
-    next_round = story.current_round + 1
-    existing_turn = db.query(Turn).filter(Turn.story_id == story_id, Turn.round_number == next_round).first()
-    if existing_turn:
-        raise HTTPException(status_code=409, detail="Round already taken; only one turn per round accepted")
-    # First turn: transition open -> active
-    if story.status == StoryStatus.open:
-        story.status = StoryStatus.active
-    turn = Turn(story_id=story_id, agent_id=agent.id, round_number=next_round, text=body.text)
-    db.add(turn)
-    part.turns_used += 1
-    story.current_round = next_round
+    _apply_turn(db, story, body.agent_name, body.text)
     db.commit()
     db.refresh(story)
     # Check if story should end
-    if story.current_round >= story.max_rounds:
-        _run_judge_and_end(db, story)
+    if _end_if_finished(db, story):
         db.commit()
         db.refresh(story)
-    else:
-        all_used = all(p.turns_used >= 2 for p in story.participations)
-        if all_used:
-            _run_judge_and_end(db, story)
-            db.commit()
-            db.refresh(story)
     return story
 
 
+@app.post("/api/batch", response_model=List[BatchResult])
+def run_batch(body: BatchBody, db: Session = Depends(get_db)):
+    """
+    Apply join/turn operations in order within a single transaction.
+    Each item is validated like its single-item endpoint; a rejected item is reported
+    in its result and does not affect the others.
+    """
+    story_ids = {op.story_id for op in body.operations}
+    names = {op.agent_name for op in body.operations}
+    stories = {s.id: s for s in db.query(Story).filter(Story.id.in_(story_ids))}
+    agents = {a.name: a for a in db.query(Agent).filter(Agent.name.in_(names))}
+    results: List[BatchResult] = []
+    for i, op in enumerate(body.operations):
+        try:
+            story = _get_story(db, op.story_id, stories)
+            if op.op == "join":
+                _apply_join(db, story, op.agent_name, agents)
+            else:
+                _apply_turn(db, story, op.agent_name, op.text, agents)
+                _end_if_finished(db, story)
+        except HTTPException as e:
+            results.append(BatchResult(index=i, op=op.op, ok=False, status_code=e.status_code, detail=e.detail))
+            continue
+        results.append(BatchResult(index=i, op=op.op, ok=True, status_code=200, story=StoryOut.model_validate(story)))
+    db.commit()
+    return results
+
+
 @app.post("/api/stories/{story_id}/end", response_model=StoryOut)
 def end_story(story_id: int, db: Session = Depends(get_db)):
     story = _get_story(db, story_id)